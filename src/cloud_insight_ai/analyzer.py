@@ -4,11 +4,14 @@ Cloud Insight AI - Main Orchestrator (Updated for JSON output)
 Coordinates cost analysis, log analysis, report generation, and notifications
 """
 
+import concurrent.futures
+import functools
 import json
+import logging
 import os
+import string
 import sys
-from datetime import datetime
-import boto3
+from datetime import datetime, timezone
 from cost_processor import CostProcessor
 from log_processor import LogProcessor
 from comprehend_client import ComprehendClient
@@ -16,6 +19,121 @@ from config_loader import ConfigLoader
 from notification_handler import NotificationHandler
 from json_report_generator import JSONReportGenerator
 
+try:
+    # Optional Rust-backed serializer; emits bytes directly and is 3-10x
+    # faster than stdlib json on the nested report payloads.
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+
+def _dump_json_bytes(obj):
+    """Serialize a report dict to pretty-printed UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+# Banner strings allocated once at import instead of per use
+_BAR80 = '=' * 80
+_DASH80 = '-' * 80
+_BAR60 = '=' * 60
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(service, region):
+    """Memoize boto3 client creation - session setup costs hundreds of ms"""
+    # Imported here so import-only paths (tooling, --help) skip the
+    # ~100 ms boto3/botocore module load.
+    import boto3
+    return boto3.client(service, region_name=region)
+
+# Report body precompiled once at import; generate_report only fills in the
+# per-run context instead of re-materializing a multi-KB f-string literal.
+_REPORT_TMPL = string.Template("""
+${bar}
+CLOUD INSIGHT AI - COMPREHENSIVE ANALYSIS REPORT
+${bar}
+
+Generated: ${timestamp}
+Report ID: ${report_id}
+
+${alert_section}
+${bar}
+SECTION 1: COST ANALYSIS
+${bar}
+
+Total Services Analyzed: ${total_services}
+Date Range: ${date_start} to ${date_end}
+
+--- Cost Summary by Service ---
+${service_breakdown}
+
+--- Cost Trends ---
+${trends}
+
+--- AI-Powered Cost Insights (AWS Comprehend) ---
+
+Key Phrases Detected:
+${cost_key_phrases}
+
+Sentiment Analysis:
+${cost_sentiment}
+
+${dash}
+
+${bar}
+SECTION 2: LOG ANALYSIS
+${bar}
+
+Total Log Entries: ${total_entries}
+Error Count: ${error_count}
+Warning Count: ${warning_count}
+Info Count: ${info_count}
+
+--- Error Severity Distribution ---
+Errors: ${error_count} (${error_percentage}%)
+Warnings: ${warning_count} (${warning_percentage}%)
+Info: ${info_count} (${info_percentage}%)
+
+--- Top Issues ---
+${top_issues}
+
+--- AI-Powered Log Insights (AWS Comprehend) ---
+
+Key Phrases Detected:
+${log_key_phrases}
+
+Sentiment Analysis:
+${log_sentiment}
+
+Entities Detected:
+${log_entities}
+
+${dash}
+
+${bar}
+SECTION 3: RECOMMENDATIONS
+${bar}
+
+Based on the analysis, here are the recommended actions:
+
+Cost Optimization:
+${cost_recommendations}
+
+Operational Improvements:
+${log_recommendations}
+
+${bar}
+END OF REPORT
+${bar}
+
+This report was generated automatically by Cloud Insight AI.
+Dashboard: Available at your S3 static website
+JSON Data: final_report.json, config.json
+""")
+
 
 class CloudInsightAnalyzer:
     """Main orchestrator for Cloud Insight AI analysis"""
@@ -34,54 +152,84 @@ class CloudInsightAnalyzer:
         self.cost_processor = CostProcessor()
         self.log_processor = LogProcessor(self.config)
         self.comprehend_client = ComprehendClient(region=self.region)
-        self.s3_client = boto3.client('s3', region_name=self.region)
+        self.s3_client = _get_client('s3', self.region)
         self.notification_handler = NotificationHandler(self.config, region=self.region)
         self.json_generator = JSONReportGenerator(self.config)
+
+        # Shared pool for concurrent S3 uploads (boto3 clients are thread-safe)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+        # Snapshot threshold config once; the alert checks run per analysis
+        # and each get_*_threshold call walks the nested config dict.
+        self.cost_increase_threshold = self.config.get_cost_threshold('cost_increase_alert_percent')
+        self.high_cost_threshold = self.config.get_cost_threshold('high_cost_service_percent')
+        self.max_errors = self.config.get_log_threshold('max_error_count')
+        self.max_warnings = self.config.get_log_threshold('max_warning_count')
+        self.max_error_rate = self.config.get_log_threshold('max_error_rate_percent')
+
+        # Feature flags are immutable for the lifetime of a run; resolve the
+        # config getters once instead of per step.
+        self.comprehend_enabled = self.config.is_comprehend_enabled()
+        self.notifications_enabled = self.config.is_notifications_enabled()
+        self.write_local_copy = self.config.get('general.write_local_copy', False)
         
-        print(f"[INFO] Cloud Insight AI initialized")
-        print(f"[INFO] S3 Bucket: {self.s3_bucket}")
-        print(f"[INFO] Region: {self.region}")
+        log.info("Cloud Insight AI initialized")
+        log.info("S3 Bucket: %s", self.s3_bucket)
+        log.info("Region: %s", self.region)
     
     def run_analysis(self):
         """Execute the complete analysis workflow"""
         try:
-            print("\n" + "="*60)
-            print("CLOUD INSIGHT AI - ANALYSIS STARTING")
-            print("="*60 + "\n")
-            
+            log.info(_BAR60)
+            log.info("CLOUD INSIGHT AI - ANALYSIS STARTING")
+            log.info(_BAR60)
+
             alerts = []  # Track alerts for notifications
-            
+
             # Step 1: Process cost data
-            print("[STEP 1] Analyzing cost data...")
+            log.info("[STEP 1] Analyzing cost data...")
             cost_summary = self.cost_processor.analyze()
             cost_alerts = self._check_cost_alerts(cost_summary)
             alerts.extend(cost_alerts)
-            print(f"[SUCCESS] Cost analysis complete ({len(cost_alerts)} alerts)")
-            
+            log.info("[STEP 1] Cost analysis complete (%d alerts)", len(cost_alerts))
+
             # Step 2: Process log data (multiple sources)
-            print("\n[STEP 2] Analyzing log data...")
+            log.info("[STEP 2] Analyzing log data...")
             log_summary = self.log_processor.analyze()
             log_alerts = self._check_log_alerts(log_summary)
             alerts.extend(log_alerts)
-            print(f"[SUCCESS] Log analysis complete ({len(log_alerts)} alerts)")
+            log.info("[STEP 2] Log analysis complete (%d alerts)", len(log_alerts))
             
             # Step 3: Enhance with AWS Comprehend (if enabled)
-            if self.config.is_comprehend_enabled():
-                print("\n[STEP 3] Enhancing insights with AWS Comprehend...")
-                enhanced_cost_insights = self.comprehend_client.analyze_text(
-                    cost_summary['text_summary']
+            if self.comprehend_enabled:
+                log.info("[STEP 3] Enhancing insights with AWS Comprehend...")
+                # The two summaries are independent; analyze them concurrently
+                # so this step pays one Comprehend round-trip instead of two.
+                # Empty summaries skip the client call entirely.
+                cost_text = cost_summary.get('text_summary', '').strip()
+                log_text = log_summary.get('text_summary', '').strip()
+                cost_future = self.executor.submit(
+                    self.comprehend_client.analyze_text, cost_text
+                ) if cost_text else None
+                log_future = self.executor.submit(
+                    self.comprehend_client.analyze_text, log_text
+                ) if log_text else None
+                enhanced_cost_insights = (
+                    cost_future.result() if cost_future
+                    else {'key_phrases': [], 'sentiment': {}, 'entities': []}
                 )
-                enhanced_log_insights = self.comprehend_client.analyze_text(
-                    log_summary['text_summary']
+                enhanced_log_insights = (
+                    log_future.result() if log_future
+                    else {'key_phrases': [], 'sentiment': {}, 'entities': []}
                 )
-                print(f"[SUCCESS] AI enhancement complete")
+                log.info("[STEP 3] AI enhancement complete")
             else:
-                print("\n[STEP 3] Comprehend disabled - skipping AI enhancement")
+                log.info("[STEP 3] Comprehend disabled - skipping AI enhancement")
                 enhanced_cost_insights = {'key_phrases': [], 'sentiment': {}, 'entities': []}
                 enhanced_log_insights = {'key_phrases': [], 'sentiment': {}, 'entities': []}
             
             # Step 4: Generate TXT report (traditional)
-            print("\n[STEP 4] Generating text report...")
+            log.info("[STEP 4] Generating text report...")
             report_content = self.generate_report(
                 cost_summary,
                 log_summary,
@@ -91,12 +239,17 @@ class CloudInsightAnalyzer:
             )
             
             report_filename = 'final_report.txt'
-            with open(report_filename, 'w') as f:
-                f.write(report_content)
-            print(f"[SUCCESS] Text report saved: {report_filename}")
-            
+            # The S3 upload reads report_content straight from memory, so the
+            # local file is only written when explicitly requested.
+            if self.write_local_copy:
+                with open(report_filename, 'w') as f:
+                    f.write(report_content)
+                log.info("[STEP 4] Text report saved: %s", report_filename)
+            else:
+                log.info("[STEP 4] Text report generated (local copy disabled)")
+
             # Step 5: Generate JSON reports for dashboard
-            print("\n[STEP 5] Generating JSON reports for dashboard...")
+            log.info("[STEP 5] Generating JSON reports for dashboard...")
             
             # Generate final_report.json
             report_json = self.json_generator.generate_report_json(
@@ -106,43 +259,58 @@ class CloudInsightAnalyzer:
                 enhanced_log_insights,
                 alerts
             )
-            self.json_generator.save_json(report_json, 'final_report.json')
-            
-            # Generate config.json
             config_json = self.json_generator.generate_config_json()
-            self.json_generator.save_json(config_json, 'config.json')
-            
-            print(f"[SUCCESS] JSON reports generated")
-            
+
+            # Serialize once and keep the bytes: the local dashboard copy and
+            # the S3 upload share the same buffer instead of write+re-read.
+            report_json_bytes = _dump_json_bytes(report_json)
+            config_json_bytes = _dump_json_bytes(config_json)
+
+            # The two writes are independent; overlap them on the shared pool
+            write_futures = [
+                self.executor.submit(self._write_file, 'final_report.json', report_json_bytes),
+                self.executor.submit(self._write_file, 'config.json', config_json_bytes),
+            ]
+            concurrent.futures.wait(write_futures)
+            for future in write_futures:
+                future.result()  # re-raise any write failure
+
+            log.info("[STEP 5] JSON reports generated")
+
             # Step 6: Upload to S3
-            print(f"\n[STEP 6] Uploading reports to S3...")
-            self.upload_to_s3(report_filename, report_content, 'text/plain')
-            self.upload_json_to_s3('final_report.json')
-            self.upload_json_to_s3('config.json')
-            print(f"[SUCCESS] All reports uploaded to S3")
-            
+            log.info("[STEP 6] Uploading reports to S3...")
+            # S3 PUTs are long-tailed; issuing them concurrently means this
+            # step waits on the slowest upload instead of the sum of all three.
+            upload_futures = [
+                self.executor.submit(self.upload_to_s3, report_filename, report_content, 'text/plain'),
+                self.executor.submit(self.upload_json_to_s3, 'final_report.json', report_json_bytes),
+                self.executor.submit(self.upload_json_to_s3, 'config.json', config_json_bytes),
+            ]
+            concurrent.futures.wait(upload_futures)
+            for future in upload_futures:
+                future.result()  # re-raise any upload failure
+            log.info("[STEP 6] All reports uploaded to S3")
+
             # Step 7: Send notifications
-            if self.config.is_notifications_enabled():
-                print(f"\n[STEP 7] Sending notifications...")
+            if self.notifications_enabled:
+                log.info("[STEP 7] Sending notifications...")
                 self.notification_handler.send_notifications(report_content, alerts)
-                print(f"[SUCCESS] Notifications sent")
+                log.info("[STEP 7] Notifications sent")
             else:
-                print(f"\n[STEP 7] Notifications disabled - skipping")
-            
-            print("\n" + "="*60)
-            print(f"ANALYSIS COMPLETE - {len(alerts)} ALERT(S) DETECTED")
-            print("="*60 + "\n")
-            
-            print(f"📊 Dashboard JSON: s3://{self.s3_bucket}/final_report.json")
-            print(f"📄 Text Report: s3://{self.s3_bucket}/final_report.txt")
-            print(f"⚙️  Config JSON: s3://{self.s3_bucket}/config.json")
-            
+                log.info("[STEP 7] Notifications disabled - skipping")
+
+            log.info(_BAR60)
+            log.info("ANALYSIS COMPLETE - %d ALERT(S) DETECTED", len(alerts))
+            log.info(_BAR60)
+
+            log.info("📊 Dashboard JSON: s3://%s/final_report.json", self.s3_bucket)
+            log.info("📄 Text Report: s3://%s/final_report.txt", self.s3_bucket)
+            log.info("⚙️  Config JSON: s3://%s/config.json", self.s3_bucket)
+
             return True
-            
-        except Exception as e:
-            print(f"\n[ERROR] Analysis failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+
+        except Exception:
+            log.exception("Analysis failed")
             return False
     
     def _check_cost_alerts(self, cost_summary):
@@ -150,14 +318,18 @@ class CloudInsightAnalyzer:
         alerts = []
         
         service_totals = cost_summary.get('service_totals', {})
-        total_cost = sum(service_totals.values())
-        
-        threshold = self.config.get_cost_threshold('cost_increase_alert_percent')
-        high_cost_threshold = self.config.get_cost_threshold('high_cost_service_percent')
-        
-        # Check for high-cost services
+        # The processor already computed the grand total; avoid re-summing
+        total_cost = cost_summary.get('total_cost', sum(service_totals.values()))
+
+        if total_cost <= 0:
+            return alerts
+
+        high_cost_threshold = self.high_cost_threshold
+
+        # Check for high-cost services (scale factor hoisted out of the loop)
+        percent_scale = 100.0 / total_cost
         for service, cost in service_totals.items():
-            percentage = (cost / total_cost * 100) if total_cost > 0 else 0
+            percentage = cost * percent_scale
             if percentage > high_cost_threshold:
                 alerts.append({
                     'severity': 'high',
@@ -175,9 +347,9 @@ class CloudInsightAnalyzer:
         warning_count = log_summary.get('warning_count', 0)
         error_rate = log_summary.get('error_percentage', 0)
         
-        max_errors = self.config.get_log_threshold('max_error_count')
-        max_warnings = self.config.get_log_threshold('max_warning_count')
-        max_error_rate = self.config.get_log_threshold('max_error_rate_percent')
+        max_errors = self.max_errors
+        max_warnings = self.max_warnings
+        max_error_rate = self.max_error_rate
         
         if error_count > max_errors:
             alerts.append({
@@ -206,117 +378,67 @@ class CloudInsightAnalyzer:
                        cost_insights, log_insights, alerts):
         """Generate the final comprehensive text report"""
         
-        timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+        # One clock read for both fields so timestamp and report ID agree;
+        # datetime.now(timezone.utc) avoids the deprecated utcnow() path.
+        now = datetime.now(timezone.utc)
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S UTC')
         
-        # Alert summary section
+        # Alert summary section (built with list+join; += string growth is
+        # quadratic on long alert lists)
         alert_section = ""
         if alerts:
-            alert_section = f"""
-{'='*80}
+            parts = [f"""
+{_BAR80}
 ⚠️  ALERT SUMMARY - {len(alerts)} ALERT(S) DETECTED
-{'='*80}
+{_BAR80}
 
-"""
-            for alert in alerts:
-                alert_section += f"  [{alert['severity'].upper()}] {alert['message']}\n"
-            alert_section += "\n"
+"""]
+            parts.extend(
+                f"  [{alert['severity'].upper()}] {alert['message']}\n"
+                for alert in alerts
+            )
+            parts.append("\n")
+            alert_section = "".join(parts)
         
-        report = f"""
-{'='*80}
-CLOUD INSIGHT AI - COMPREHENSIVE ANALYSIS REPORT
-{'='*80}
-
-Generated: {timestamp}
-Report ID: {datetime.utcnow().strftime('%Y%m%d-%H%M%S')}
-
-{alert_section}
-{'='*80}
-SECTION 1: COST ANALYSIS
-{'='*80}
-
-Total Services Analyzed: {cost_summary['total_services']}
-Date Range: {cost_summary['date_range']['start']} to {cost_summary['date_range']['end']}
-
---- Cost Summary by Service ---
-{cost_summary['service_breakdown']}
-
---- Cost Trends ---
-{cost_summary['trends']}
-
---- AI-Powered Cost Insights (AWS Comprehend) ---
-
-Key Phrases Detected:
-{self._format_key_phrases(cost_insights.get('key_phrases', []))}
-
-Sentiment Analysis:
-{self._format_sentiment(cost_insights.get('sentiment', {}))}
-
-{'-'*80}
-
-{'='*80}
-SECTION 2: LOG ANALYSIS
-{'='*80}
-
-Total Log Entries: {log_summary['total_entries']}
-Error Count: {log_summary['error_count']}
-Warning Count: {log_summary['warning_count']}
-Info Count: {log_summary['info_count']}
-
---- Error Severity Distribution ---
-Errors: {log_summary['error_count']} ({log_summary['error_percentage']:.1f}%)
-Warnings: {log_summary['warning_count']} ({log_summary['warning_percentage']:.1f}%)
-Info: {log_summary['info_count']} ({log_summary['info_percentage']:.1f}%)
-
---- Top Issues ---
-{log_summary['top_issues']}
-
---- AI-Powered Log Insights (AWS Comprehend) ---
-
-Key Phrases Detected:
-{self._format_key_phrases(log_insights.get('key_phrases', []))}
-
-Sentiment Analysis:
-{self._format_sentiment(log_insights.get('sentiment', {}))}
-
-Entities Detected:
-{self._format_entities(log_insights.get('entities', []))}
-
-{'-'*80}
-
-{'='*80}
-SECTION 3: RECOMMENDATIONS
-{'='*80}
-
-Based on the analysis, here are the recommended actions:
-
-Cost Optimization:
-{cost_summary['recommendations']}
-
-Operational Improvements:
-{log_summary['recommendations']}
-
-{'='*80}
-END OF REPORT
-{'='*80}
-
-This report was generated automatically by Cloud Insight AI.
-Dashboard: Available at your S3 static website
-JSON Data: final_report.json, config.json
-"""
-        return report
+        context = {
+            'bar': _BAR80,
+            'dash': _DASH80,
+            'timestamp': timestamp,
+            'report_id': now.strftime('%Y%m%d-%H%M%S'),
+            'alert_section': alert_section,
+            'total_services': cost_summary['total_services'],
+            'date_start': cost_summary['date_range']['start'],
+            'date_end': cost_summary['date_range']['end'],
+            'service_breakdown': cost_summary['service_breakdown'],
+            'trends': cost_summary['trends'],
+            'cost_key_phrases': self._format_key_phrases(cost_insights.get('key_phrases', [])),
+            'cost_sentiment': self._format_sentiment(cost_insights.get('sentiment', {})),
+            'total_entries': log_summary['total_entries'],
+            'error_count': log_summary['error_count'],
+            'warning_count': log_summary['warning_count'],
+            'info_count': log_summary['info_count'],
+            'error_percentage': f"{log_summary['error_percentage']:.1f}",
+            'warning_percentage': f"{log_summary['warning_percentage']:.1f}",
+            'info_percentage': f"{log_summary['info_percentage']:.1f}",
+            'top_issues': log_summary['top_issues'],
+            'log_key_phrases': self._format_key_phrases(log_insights.get('key_phrases', [])),
+            'log_sentiment': self._format_sentiment(log_insights.get('sentiment', {})),
+            'log_entities': self._format_entities(log_insights.get('entities', [])),
+            'cost_recommendations': cost_summary['recommendations'],
+            'log_recommendations': log_summary['recommendations'],
+        }
+        return _REPORT_TMPL.substitute(context)
     
     def _format_key_phrases(self, key_phrases):
         """Format key phrases from Comprehend"""
         if not key_phrases:
             return "  No key phrases detected"
         
-        formatted = []
-        for phrase in key_phrases[:10]:
-            score = phrase.get('Score', 0) * 100
-            text = phrase.get('Text', 'Unknown')
-            formatted.append(f"  • {text} (confidence: {score:.1f}%)")
-        
-        return "\n".join(formatted)
+        return "\n".join(
+            f"  • {phrase.get('Text', 'Unknown')} "
+            f"(confidence: {phrase.get('Score', 0) * 100:.1f}%)"
+            for phrase in key_phrases[:10]
+        )
     
     def _format_sentiment(self, sentiment):
         """Format sentiment analysis from Comprehend"""
@@ -337,14 +459,11 @@ JSON Data: final_report.json, config.json
         if not entities:
             return "  No entities detected"
         
-        formatted = []
-        for entity in entities[:10]:
-            score = entity.get('Score', 0) * 100
-            text = entity.get('Text', 'Unknown')
-            entity_type = entity.get('Type', 'UNKNOWN')
-            formatted.append(f"  • {text} ({entity_type}, confidence: {score:.1f}%)")
-        
-        return "\n".join(formatted)
+        return "\n".join(
+            f"  • {entity.get('Text', 'Unknown')} ({entity.get('Type', 'UNKNOWN')}, "
+            f"confidence: {entity.get('Score', 0) * 100:.1f}%)"
+            for entity in entities[:10]
+        )
     
     def upload_to_s3(self, filename, content, content_type):
         """Upload text report to S3 bucket"""
@@ -355,39 +474,59 @@ JSON Data: final_report.json, config.json
                 Body=content.encode('utf-8'),
                 ContentType=content_type
             )
-            print(f"[INFO] Uploaded {filename} to S3")
+            log.info("Uploaded %s to S3", filename)
         except Exception as e:
-            print(f"[ERROR] S3 upload failed for {filename}: {str(e)}")
+            log.error("S3 upload failed for %s: %s", filename, e)
             raise
-    
-    def upload_json_to_s3(self, filename):
-        """Upload JSON file to S3 WITHOUT ACL (bucket doesn't support it)"""
+
+    def upload_json_to_s3(self, filename, content=None):
+        """Upload JSON to S3 WITHOUT ACL (bucket doesn't support it)
+
+        When the serialized bytes are already in memory, pass them as
+        `content` to skip re-reading the file from disk; otherwise the file
+        handle is streamed in chunks by boto3.
+        """
         try:
-            with open(filename, 'r') as f:
-                content = f.read()
-            
-            self.s3_client.put_object(
-                Bucket=self.s3_bucket,
-                Key=filename,
-                Body=content,
-                ContentType='application/json',
-                # REMOVED: ACL='public-read' - bucket doesn't support ACLs
-                CacheControl='no-cache, no-store, must-revalidate'
-            )
-            print(f"[INFO] Uploaded {filename} to S3")
+            if content is not None:
+                self._put_json(filename, content)
+            else:
+                with open(filename, 'rb') as f:
+                    self._put_json(filename, f)
+            log.info("Uploaded %s to S3", filename)
         except Exception as e:
-            print(f"[ERROR] S3 upload failed for {filename}: {str(e)}")
+            log.error("S3 upload failed for %s: %s", filename, e)
             raise
 
+    @staticmethod
+    def _write_file(filename, data):
+        """Write bytes to a local file in one shot"""
+        with open(filename, 'wb') as f:
+            f.write(data)
+
+    def _put_json(self, filename, body):
+        self.s3_client.put_object(
+            Bucket=self.s3_bucket,
+            Key=filename,
+            Body=body,
+            ContentType='application/json',
+            # REMOVED: ACL='public-read' - bucket doesn't support ACLs
+            CacheControl='no-cache, no-store, must-revalidate'
+        )
+
 
 def main():
     """Main entry point"""
+    logging.basicConfig(
+        level=os.environ.get('LOG_LEVEL', 'INFO'),
+        format='[%(levelname)s] %(message)s',
+        stream=sys.stdout
+    )
     try:
         analyzer = CloudInsightAnalyzer()
         success = analyzer.run_analysis()
         sys.exit(0 if success else 1)
     except Exception as e:
-        print(f"[FATAL] Application error: {str(e)}")
+        log.error("Application error: %s", e)
         sys.exit(1)
 
 
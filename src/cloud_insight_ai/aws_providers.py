@@ -6,20 +6,59 @@ Author: MUBENDIRAN
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from .providers import AIProvider, StorageProvider
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_client(service: str, region: str):
+    """Build a boto3 client once per (service, region) and reuse it.
+
+    Client construction loads service models and negotiates credentials
+    (hundreds of ms); memoizing makes repeated provider instantiation cheap.
+    """
+    import boto3
+    return boto3.client(service, region_name=region)
+
+
+def _truncate_utf8(text: str, limit: int = 5000) -> str:
+    """Clamp text to Comprehend's byte limit without splitting a codepoint.
+
+    UTF-8 is at most 4 bytes per char, so when 4 * char count fits the cap
+    we skip encoding the whole string just to measure it. Slicing happens by
+    bytes, not characters - a character slice can still exceed the byte
+    limit for multibyte text - and 'ignore' drops a trailing partial
+    codepoint.
+    """
+    if len(text) * 4 > limit:
+        encoded = text.encode('utf-8')
+        if len(encoded) > limit:
+            return encoded[:limit].decode('utf-8', 'ignore')
+    return text
+
+
+def _log_batch_errors(response, start, operation):
+    """Log per-document failures reported in a batch response's ErrorList"""
+    for err in response.get('ErrorList', []):
+        logger.error(
+            f"{operation} failed for document {start + err.get('Index', 0)}: "
+            f"{err.get('ErrorMessage', 'unknown error')}"
+        )
+
+
 class AWSComprehendProvider(AIProvider):
     """AWS Comprehend NLP provider"""
-    
+
+    __slots__ = ('region', 'client')
+
     def __init__(self, region: str = 'us-east-1'):
         self.region = region
         try:
-            import boto3
-            self.client = boto3.client('comprehend', region_name=region)
+            self.client = _get_client('comprehend', region)
             logger.info(f"AWS Comprehend initialized: {region}")
         except ImportError:
             logger.warning("boto3 not available - using mock provider")
@@ -29,16 +68,67 @@ class AWSComprehendProvider(AIProvider):
         if not text or len(text.strip()) < 10:
             return {'key_phrases': [], 'sentiment': {}, 'entities': []}
         
-        # Truncate if needed
-        if len(text.encode('utf-8')) > 5000:
-            text = text[:5000]
-        
-        return {
-            'key_phrases': self.detect_key_phrases(text),
-            'sentiment': self.detect_sentiment(text),
-            'entities': self.detect_entities(text)
-        }
+        # Truncate if needed - Comprehend rejects documents over 5000 bytes
+        text = _truncate_utf8(text)
+
+        # The three detect calls are independent network round-trips; run them
+        # concurrently so the step costs one round-trip instead of three.
+        # boto3 clients are thread-safe for API calls.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            key_phrases = executor.submit(self.detect_key_phrases, text)
+            sentiment = executor.submit(self.detect_sentiment, text)
+            entities = executor.submit(self.detect_entities, text)
+            return {
+                'key_phrases': key_phrases.result(),
+                'sentiment': sentiment.result(),
+                'entities': entities.result()
+            }
     
+    def analyze_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze many texts via the batch_detect_* APIs (25 docs per request)"""
+        results = [
+            {'key_phrases': [], 'sentiment': {}, 'entities': []}
+            for _ in texts
+        ]
+        if not self.client or not texts:
+            return results
+
+        batch_size = 25  # Comprehend batch API limit
+        for start in range(0, len(texts), batch_size):
+            # Truncate each document like analyze_text does: one oversized
+            # document would otherwise fail the whole batch call and wipe
+            # the results for all 25 documents in the chunk.
+            chunk = [_truncate_utf8(t) for t in texts[start:start + batch_size]]
+            try:
+                response = self.client.batch_detect_key_phrases(
+                    TextList=chunk, LanguageCode='en')
+                for item in response.get('ResultList', []):
+                    results[start + item['Index']]['key_phrases'] = item.get('KeyPhrases', [])
+                _log_batch_errors(response, start, "Batch key phrase detection")
+            except Exception as e:
+                logger.error(f"Batch key phrase detection failed: {e}")
+            try:
+                response = self.client.batch_detect_sentiment(
+                    TextList=chunk, LanguageCode='en')
+                for item in response.get('ResultList', []):
+                    results[start + item['Index']]['sentiment'] = {
+                        'Sentiment': item.get('Sentiment'),
+                        'SentimentScore': item.get('SentimentScore', {})
+                    }
+                _log_batch_errors(response, start, "Batch sentiment detection")
+            except Exception as e:
+                logger.error(f"Batch sentiment detection failed: {e}")
+            try:
+                response = self.client.batch_detect_entities(
+                    TextList=chunk, LanguageCode='en')
+                for item in response.get('ResultList', []):
+                    results[start + item['Index']]['entities'] = item.get('Entities', [])
+                _log_batch_errors(response, start, "Batch entity detection")
+            except Exception as e:
+                logger.error(f"Batch entity detection failed: {e}")
+
+        return results
+
     def detect_key_phrases(self, text: str) -> List[Dict[str, Any]]:
         if not self.client:
             return []
@@ -75,13 +165,14 @@ class AWSComprehendProvider(AIProvider):
 
 class S3StorageProvider(StorageProvider):
     """AWS S3 storage provider"""
-    
+
+    __slots__ = ('bucket_name', 'region', 'client')
+
     def __init__(self, bucket_name: str, region: str = 'us-east-1'):
         self.bucket_name = bucket_name
         self.region = region
         try:
-            import boto3
-            self.client = boto3.client('s3', region_name=region)
+            self.client = _get_client('s3', region)
             logger.info(f"S3 storage initialized: {bucket_name}")
         except ImportError:
             logger.warning("boto3 not available")
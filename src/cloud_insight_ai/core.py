@@ -30,6 +30,11 @@ class CloudAnalyzer:
                 - error_patterns (list): Custom error patterns
         """
         self.config = config or {}
+        # Materialize threshold sub-dicts once so alert generation does a
+        # single dict hit per threshold instead of walking nested gets on
+        # every run.
+        self._cost_thresholds = self.config.get('cost_thresholds', {})
+        self._log_thresholds = self.config.get('log_thresholds', {})
     
     def run(self, cost_data: List[Dict[str, Any]], logs: List[str]) -> Dict[str, Any]:
         """
@@ -81,8 +86,7 @@ class CloudAnalyzer:
         alerts = []
         
         # Cost alerts
-        cost_thresholds = self.config.get('cost_thresholds', {})
-        high_cost_percent = cost_thresholds.get('high_cost_service_percent', 30.0)
+        high_cost_percent = self._cost_thresholds.get('high_cost_service_percent', 30.0)
         
         total_cost = cost_result['total_cost']
         if total_cost > 0:
@@ -96,9 +100,8 @@ class CloudAnalyzer:
                     })
         
         # Log alerts
-        log_thresholds = self.config.get('log_thresholds', {})
-        max_errors = log_thresholds.get('max_error_count', 15)
-        max_warnings = log_thresholds.get('max_warning_count', 25)
+        max_errors = self._log_thresholds.get('max_error_count', 15)
+        max_warnings = self._log_thresholds.get('max_warning_count', 25)
         
         if log_result['error_count'] > max_errors:
             alerts.append({
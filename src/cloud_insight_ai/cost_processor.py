@@ -6,8 +6,16 @@ Cost Processor - Analyzes AWS billing data
 import json
 from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Any, Optional, Union
 
+try:
+    # Optional Rust-backed parser; 3-10x faster than stdlib json on the
+    # nested billing payloads. Falls back to stdlib when not installed.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def analyze_cost(cost_data: List[Dict[str, Any]], threshold: float = 0):
     """
@@ -74,8 +82,13 @@ def analyze_cost(cost_data: List[Dict[str, Any]], threshold: float = 0):
         service_totals[service] += cost
         daily_costs[date] += cost
     
+    # Freeze the defaultdicts (missing keys now raise) so they can be
+    # returned directly instead of copied into fresh dicts.
+    service_totals.default_factory = None
+    daily_costs.default_factory = None
+
     # Find highest cost service
-    highest_service = max(service_totals.items(), key=lambda x: x[1]) if service_totals else (None, 0)
+    highest_service = max(service_totals.items(), key=itemgetter(1)) if service_totals else (None, 0)
     
     total_cost = sum(service_totals.values())
     
@@ -86,8 +99,8 @@ def analyze_cost(cost_data: List[Dict[str, Any]], threshold: float = 0):
     
     result = {
         'total_cost': total_cost,
-        'service_totals': dict(service_totals),
-        'daily_costs': dict(daily_costs),
+        'service_totals': service_totals,
+        'daily_costs': daily_costs,
         'highest_cost_service': highest_service[0],
         'highest_cost': highest_service[1],
         'text_summary': summary
@@ -113,8 +126,11 @@ class CostProcessor:
         """Load cost data from JSON file"""
         print(f"[INFO] Loading cost data from {self.data_file}")
         try:
-            with open(self.data_file, 'r') as f:
-                self.costs = json.load(f)
+            # Binary mode with a 64 KiB buffer: the JSON parser consumes raw
+            # bytes directly instead of going through the text-IO wrapper.
+            with open(self.data_file, 'rb', buffering=1 << 16) as f:
+                raw = f.read()
+            self.costs = orjson.loads(raw) if orjson else json.loads(raw)
             print(f"[INFO] Loaded {len(self.costs)} cost records")
             return True
         except FileNotFoundError:
@@ -128,46 +144,71 @@ class CostProcessor:
         """Perform cost analysis and return summary"""
         self.load_data()
         
-        # Aggregate costs by service
+        # Aggregate in a single pass: running totals plus the earliest and
+        # latest record per service. This replaces the dict-of-lists layout
+        # and the per-service sort that trend calculation used to need.
         service_totals = defaultdict(float)
-        service_daily = defaultdict(list)
-        
+        daily_totals = defaultdict(float)
+        first_seen = {}  # service -> (date, cost) at earliest date
+        last_seen = {}   # service -> (date, cost) at latest date
+
         all_dates = set()
-        
+
         for record in self.costs:
             service = record['service']
             date = record['date']
             cost = record['cost']
-            
+
             service_totals[service] += cost
-            service_daily[service].append({
-                'date': date,
-                'cost': cost
-            })
+            daily_totals[date] += cost
+            if service not in first_seen or date < first_seen[service][0]:
+                first_seen[service] = (date, cost)
+            # >= so that ties on the latest date resolve to the last record
+            # in file order, matching the stable sort this loop replaced.
+            if service not in last_seen or date >= last_seen[service][0]:
+                last_seen[service] = (date, cost)
             all_dates.add(date)
-        
+
         # Calculate trends
-        trends = self._calculate_trends(service_daily)
-        
+        trends = self._calculate_trends(first_seen, last_seen)
+
+        # Rank services by cost once; the summary and breakdown both consume
+        # this ordering instead of re-sorting/re-scanning service_totals.
+        sorted_services = sorted(
+            service_totals.items(), key=itemgetter(1), reverse=True
+        )
+
+        # Grand total computed once and threaded through every consumer so
+        # all report fields agree on the same figure.
+        total_cost = sum(service_totals.values())
+
+        # Freeze the defaultdict so it can be returned without an O(S) copy
+        service_totals.default_factory = None
+
         # Generate text summary for Comprehend
         text_summary = self._generate_text_summary(
-            service_totals, 
-            trends, 
+            total_cost,
+            sorted_services,
+            trends,
             all_dates
         )
-        
+
         # Format service breakdown
-        service_breakdown = self._format_service_breakdown(service_totals)
+        service_breakdown = self._format_service_breakdown(sorted_services)
         
         # Format trends
         trends_text = self._format_trends(trends)
         
         # Generate recommendations
-        recommendations = self._generate_recommendations(trends, service_totals)
+        recommendations = self._generate_recommendations(trends, service_totals, total_cost)
         
         return {
+            'total_cost': total_cost,
             'total_services': len(service_totals),
-            'service_totals': dict(service_totals),
+            'service_totals': service_totals,
+            # Real per-day spend history for downstream trend charts, sorted
+            # by date so consumers never have to re-sort.
+            'daily_totals': dict(sorted(daily_totals.items())),
             'date_range': {
                 'start': min(all_dates),
                 'end': max(all_dates)
@@ -178,21 +219,17 @@ class CostProcessor:
             'recommendations': recommendations
         }
     
-    def _calculate_trends(self, service_daily):
-        """Calculate cost trends for each service"""
+    def _calculate_trends(self, first_seen, last_seen):
+        """Calculate cost trends for each service from its first/last record"""
         trends = {}
-        
-        for service, records in service_daily.items():
-            if len(records) < 2:
+
+        for service, (first_date, first_cost) in first_seen.items():
+            last_date, last_cost = last_seen[service]
+            if first_date == last_date:
+                # Single observation - no trend to compute
                 trends[service] = {'change': 0, 'direction': 'stable'}
                 continue
-            
-            # Sort by date
-            sorted_records = sorted(records, key=lambda x: x['date'])
-            
-            first_cost = sorted_records[0]['cost']
-            last_cost = sorted_records[-1]['cost']
-            
+
             change_percent = ((last_cost - first_cost) / first_cost) * 100 if first_cost != 0 else 0
             
             if change_percent > 5:
@@ -211,11 +248,10 @@ class CostProcessor:
         
         return trends
     
-    def _generate_text_summary(self, service_totals, trends, dates):
+    def _generate_text_summary(self, total_cost, sorted_services, trends, dates):
         """Generate natural language summary for Comprehend analysis"""
-        
-        total_cost = sum(service_totals.values())
-        top_service = max(service_totals.items(), key=lambda x: x[1])
+
+        top_service = sorted_services[0]
         
         # Find services with significant trends
         increasing = [s for s, t in trends.items() 
@@ -225,7 +261,7 @@ class CostProcessor:
         
         summary = f"""
 AWS cost analysis reveals a total expenditure of ${total_cost:.2f} across 
-{len(service_totals)} services over {len(dates)} days. The highest cost service 
+{len(sorted_services)} services over {len(dates)} days. The highest cost service 
 is {top_service[0]} with ${top_service[1]:.2f} in total spending.
 
 Cost trends show that {len(increasing)} services are experiencing cost increases, 
@@ -238,19 +274,11 @@ stable, indicating consistent workload patterns.
 """
         return summary.strip()
     
-    def _format_service_breakdown(self, service_totals):
-        """Format service costs for report"""
-        sorted_services = sorted(
-            service_totals.items(), 
-            key=lambda x: x[1], 
-            reverse=True
+    def _format_service_breakdown(self, sorted_services):
+        """Format service costs (pre-sorted by cost) for report"""
+        return "\n".join(
+            f"  • {service}: ${cost:.2f}" for service, cost in sorted_services
         )
-        
-        lines = []
-        for service, cost in sorted_services:
-            lines.append(f"  • {service}: ${cost:.2f}")
-        
-        return "\n".join(lines)
     
     def _format_trends(self, trends):
         """Format trend analysis for report"""
@@ -275,7 +303,7 @@ stable, indicating consistent workload patterns.
         
         return "\n".join(lines)
     
-    def _generate_recommendations(self, trends, service_totals):
+    def _generate_recommendations(self, trends, service_totals, total_cost):
         """Generate cost optimization recommendations"""
         recommendations = []
         
@@ -287,12 +315,14 @@ stable, indicating consistent workload patterns.
                     f"{trend['change']:.1f}% and may need optimization"
                 )
         
-        # Check for expensive services
-        total = sum(service_totals.values())
+        # Check for expensive services. Compare against a precomputed cost
+        # threshold so the loop avoids a division per service; the percentage
+        # is only computed for services that actually trigger.
+        threshold_cost = total_cost * 0.3  # More than 30% of total
         for service, cost in service_totals.items():
-            if cost / total > 0.3:  # More than 30% of total
+            if cost > threshold_cost:
                 recommendations.append(
-                    f"  • {service} accounts for {(cost/total)*100:.1f}% of "
+                    f"  • {service} accounts for {cost * 100.0 / total_cost:.1f}% of "
                     f"total costs - consider reserved instances or savings plans"
                 )
         
@@ -5,9 +5,24 @@ Log Processor - Analyzes multiple system log sources
 
 import re
 from collections import Counter, defaultdict
+from heapq import nlargest
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 
 
+# Canonical empty level breakdown, shared (read-only) by empty results so
+# report consumers can splat a prebuilt dict instead of four .get calls.
+_EMPTY_LEVELS = {'critical': 0, 'error': 0, 'warning': 0, 'info': 0}
+
+# Compiled once at import; matching against a string pattern would re-do the
+# re-cache lookup on every line of every log file. Leading/trailing
+# whitespace (including the newline) is absorbed by the pattern itself so
+# callers never need to strip() a copy of each line first. The message must
+# start with a non-space so level-only lines like "... [INFO]" are dropped,
+# exactly as they were under the old strip-then-match.
+_LOG_RE = re.compile(r'\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+\[(\w+)\]\s+(\S.*?)\s*$')
+
+
 def analyze_logs(logs: List[Any], error_patterns: Optional[List[Dict]] = None) -> Dict[str, Any]:
     """
     Analyze log entries and return summary.
@@ -25,6 +40,7 @@ def analyze_logs(logs: List[Any], error_patterns: Optional[List[Dict]] = None) -
             'error_count': 0,
             'warning_count': 0,
             'log_levels': {},
+            'levels': _EMPTY_LEVELS,
             'error_patterns': {},
             'text_summary': 'No log data available',
             'recommendations': 'No logs to analyze'
@@ -64,12 +80,13 @@ def analyze_logs(logs: List[Any], error_patterns: Optional[List[Dict]] = None) -
     if error_patterns:
         for pattern in error_patterns:
             pattern_name = pattern.get('name', 'Unknown')
-            keywords = pattern.get('keywords', [])
+            # Lowered once per pattern rather than once per line.
+            keywords = [k.lower() for k in pattern.get('keywords', [])]
             count = 0
-            
+
             for line in errors:
                 line_lower = line.lower()
-                if any(keyword.lower() in line_lower for keyword in keywords):
+                if any(keyword in line_lower for keyword in keywords):
                     count += 1
             
             if count > 0:
@@ -95,6 +112,14 @@ def analyze_logs(logs: List[Any], error_patterns: Optional[List[Dict]] = None) -
         'error_count': error_count,
         'warning_count': warning_count,
         'log_levels': dict(log_levels),
+        # Canonical breakdown prebuilt here so report consumers read one
+        # field instead of repeating .get chains per report.
+        'levels': {
+            'critical': log_levels.get('CRITICAL', 0),
+            'error': log_levels.get('ERROR', 0),
+            'warning': log_levels.get('WARNING', 0),
+            'info': log_levels.get('INFO', 0),
+        },
         'error_patterns': pattern_matches,
         'text_summary': summary,
         'recommendations': recommendations_text
@@ -103,7 +128,18 @@ def analyze_logs(logs: List[Any], error_patterns: Optional[List[Dict]] = None) -
 
 class LogProcessor:
     """Processes and analyzes system log files from multiple sources"""
-    
+
+    # Specialized summary for the common all-clear run: no pattern ranking,
+    # rate formatting, or incident narrative needs to be built.
+    _HEALTHY_SUMMARY = (
+        "System log analysis across multiple sources reveals {total} log "
+        "entries with no errors or warnings detected. All monitored services "
+        "are producing healthy log output with normal informational activity.\n\n"
+        "Log sources analyzed: {source_breakdown}.\n\n"
+        "No recurring problem categories, connectivity failures, or resource "
+        "exhaustion patterns were observed. Routine monitoring can continue."
+    )
+
     def __init__(self, config):
         self.config = config
         self.log_entries = []
@@ -126,19 +162,16 @@ class LogProcessor:
             description = source.get('description', path)
             
             try:
+                # Stream line-by-line instead of readlines(): no whole-file
+                # list, and each entry is a compact tuple rather than a
+                # per-line dict with four interned-key slots.
+                count = 0
                 with open(path, 'r') as f:
-                    entries = f.readlines()
-                
-                # Tag each entry with source info
-                for entry in entries:
-                    all_entries.append({
-                        'raw': entry,
-                        'source': path,
-                        'type': source_type,
-                        'description': description
-                    })
-                
-                print(f"[INFO] Loaded {len(entries)} entries from {description}")
+                    for line in f:
+                        all_entries.append((line, path, source_type, description))
+                        count += 1
+
+                print(f"[INFO] Loaded {count} entries from {description}")
             
             except FileNotFoundError:
                 print(f"[WARNING] Log file not found: {path}")
@@ -159,15 +192,21 @@ class LogProcessor:
         
         # Parse logs
         parsed_logs = self._parse_logs()
-        
-        # Count by severity
-        severity_counts = Counter(log['level'] for log in parsed_logs)
-        
-        # Count by source type
-        source_counts = Counter(log['type'] for log in parsed_logs)
-        
+
+        # Single pass over the parsed entries: severity and source tallies
+        # plus the ERROR/WARNING subset that pattern extraction needs,
+        # instead of three separate walks over the list.
+        severity_counts = Counter()
+        source_counts = Counter()
+        problem_logs = []
+        for log in parsed_logs:
+            severity_counts[log['level']] += 1
+            source_counts[log['type']] += 1
+            if log['level'] in ('ERROR', 'WARNING'):
+                problem_logs.append(log)
+
         # Extract error patterns (using config)
-        error_patterns = self._extract_error_patterns(parsed_logs)
+        error_patterns = self._extract_error_patterns(problem_logs)
         
         # Generate text summary for Comprehend
         text_summary = self._generate_text_summary(
@@ -187,15 +226,22 @@ class LogProcessor:
         )
         
         total = len(parsed_logs)
-        
+
+        # Bind each severity count once; the counts and percentages below
+        # would otherwise hit the Counter twice per level.
+        errors = severity_counts.get('ERROR', 0)
+        warnings = severity_counts.get('WARNING', 0)
+        infos = severity_counts.get('INFO', 0)
+        percent_scale = 100.0 / total if total > 0 else 0.0
+
         return {
             'total_entries': total,
-            'error_count': severity_counts.get('ERROR', 0),
-            'warning_count': severity_counts.get('WARNING', 0),
-            'info_count': severity_counts.get('INFO', 0),
-            'error_percentage': (severity_counts.get('ERROR', 0) / total * 100) if total > 0 else 0,
-            'warning_percentage': (severity_counts.get('WARNING', 0) / total * 100) if total > 0 else 0,
-            'info_percentage': (severity_counts.get('INFO', 0) / total * 100) if total > 0 else 0,
+            'error_count': errors,
+            'warning_count': warnings,
+            'info_count': infos,
+            'error_percentage': errors * percent_scale,
+            'warning_percentage': warnings * percent_scale,
+            'info_percentage': infos * percent_scale,
             'source_breakdown': dict(source_counts),
             'top_issues': top_issues,
             'text_summary': text_summary,
@@ -220,27 +266,30 @@ class LogProcessor:
     
     def _parse_logs(self):
         """Parse log entries into structured format"""
-        log_pattern = r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+\[(\w+)\]\s+(.*)'
-        
         parsed = []
-        for entry_data in self.log_entries:
-            line = entry_data['raw']
-            match = re.match(log_pattern, line.strip())
+        match_line = _LOG_RE.match  # bound once; skips attr lookup per line
+        for line, source, source_type, description in self.log_entries:
+            # Every well-formed line carries a [LEVEL] tag; the substring
+            # check is a vectorized scan, far cheaper than letting the regex
+            # engine reject blank/malformed lines.
+            if '[' not in line:
+                continue
+            match = match_line(line)
             if match:
                 timestamp, level, message = match.groups()
                 parsed.append({
                     'timestamp': timestamp,
                     'level': level,
                     'message': message,
-                    'source': entry_data['source'],
-                    'type': entry_data['type'],
-                    'description': entry_data['description']
+                    'source': source,
+                    'type': source_type,
+                    'description': description
                 })
         
         return parsed
     
-    def _extract_error_patterns(self, parsed_logs):
-        """Extract error patterns using config-defined patterns"""
+    def _extract_error_patterns(self, problem_logs):
+        """Extract error patterns from pre-filtered ERROR/WARNING entries"""
         error_types = defaultdict(int)
         
         # Get patterns from config
@@ -254,17 +303,20 @@ class LogProcessor:
                 {'name': 'Resource Limits', 'keywords': ['memory', 'disk', 'throughput', 'limit exceeded']},
             ]
         
-        for log in parsed_logs:
-            if log['level'] in ['ERROR', 'WARNING']:
-                message_lower = log['message'].lower()
-                
-                for pattern in configured_patterns:
-                    pattern_name = pattern.get('name', 'Unknown')
-                    keywords = pattern.get('keywords', [])
-                    
-                    if any(keyword.lower() in message_lower for keyword in keywords):
-                        error_types[pattern_name] += 1
-                        break
+        # Lowercase every keyword once up front; the loop below previously
+        # re-lowered each keyword for every ERROR/WARNING line.
+        prepared_patterns = [
+            (p.get('name', 'Unknown'), [k.lower() for k in p.get('keywords', [])])
+            for p in configured_patterns
+        ]
+
+        for log in problem_logs:
+            message_lower = log['message'].lower()
+
+            for pattern_name, keywords in prepared_patterns:
+                if any(keyword in message_lower for keyword in keywords):
+                    error_types[pattern_name] += 1
+                    break
         
         return error_types
     
@@ -275,10 +327,15 @@ class LogProcessor:
         total = len(parsed_logs)
         errors = severity_counts.get('ERROR', 0)
         warnings = severity_counts.get('WARNING', 0)
-        
-        top_pattern = max(error_patterns.items(), key=lambda x: x[1]) if error_patterns else ('None', 0)
-        
+
         source_breakdown = ', '.join([f"{count} {stype} logs" for stype, count in source_counts.items()])
+
+        if not errors and not warnings:
+            return self._HEALTHY_SUMMARY.format(
+                total=total, source_breakdown=source_breakdown
+            )
+
+        top_pattern = max(error_patterns.items(), key=itemgetter(1)) if error_patterns else ('None', 0)
         
         summary = f"""
 System log analysis across multiple sources reveals {total} log entries with {errors} errors and 
@@ -307,17 +364,17 @@ optimization opportunities and resource scaling needs.
     
     def _format_top_issues(self, error_patterns):
         """Format top issues for report"""
-        sorted_issues = sorted(
-            error_patterns.items(), 
-            key=lambda x: x[1], 
-            reverse=True
+        if not error_patterns:
+            return "  No significant issues detected"
+
+        # Only the top 10 make the report, so keep a bounded heap instead of
+        # fully sorting the pattern counts (O(n log 10) vs O(n log n)).
+        top_issues = nlargest(10, error_patterns.items(), key=itemgetter(1))
+
+        return "\n".join(
+            f"  • {issue_type}: {count} occurrences"
+            for issue_type, count in top_issues
         )
-        
-        lines = []
-        for issue_type, count in sorted_issues[:10]:
-            lines.append(f"  • {issue_type}: {count} occurrences")
-        
-        return "\n".join(lines) if lines else "  No significant issues detected"
     
     def _generate_recommendations(self, severity_counts, error_patterns):
         """Generate operational recommendations"""
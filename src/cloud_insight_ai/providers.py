@@ -12,6 +12,8 @@ from typing import Dict, Any, List, Optional
 class AIProvider(ABC):
     """Abstract base class for AI/NLP providers"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """Analyze text and return insights"""
@@ -36,6 +38,8 @@ class AIProvider(ABC):
 class StorageProvider(ABC):
     """Abstract base class for storage providers"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def upload_file(self, filename: str, content: bytes, content_type: str) -> bool:
         """Upload file"""
@@ -55,6 +59,8 @@ class StorageProvider(ABC):
 class MockAIProvider(AIProvider):
     """Mock AI provider for testing"""
     
+    __slots__ = ()
+    
     def analyze_text(self, text: str) -> Dict[str, Any]:
         return {
             'key_phrases': [{'Text': 'mock phrase', 'Score': 0.95}],
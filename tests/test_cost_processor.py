@@ -4,6 +4,8 @@ Tests for cost processor module
 Tests the analyze_cost function and cost analysis functionality
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 from pathlib import Path
@@ -13,7 +15,7 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from cloud_insight_ai.cost_processor import analyze_cost
+from cloud_insight_ai.cost_processor import CostProcessor, analyze_cost
 
 
 class TestCostProcessor(unittest.TestCase):
@@ -91,5 +93,39 @@ class TestCostTrendAnalysis(unittest.TestCase):
         self.assertIsNotNone(result)
 
 
+class TestCostProcessorTrends(unittest.TestCase):
+    """Test cases for CostProcessor trend calculation"""
+
+    def _analyze(self, records):
+        """Run CostProcessor.analyze over an in-memory record list"""
+        with tempfile.NamedTemporaryFile(
+            'w', suffix='.json', delete=False
+        ) as f:
+            json.dump(records, f)
+            path = f.name
+        try:
+            return CostProcessor(data_file=path).analyze()
+        finally:
+            os.unlink(path)
+
+    def test_duplicate_last_date_uses_final_record(self):
+        """Ties on the latest date resolve to the last record in file order"""
+        result = self._analyze([
+            {"service": "EC2", "date": "2024-01-01", "cost": 10.0},
+            {"service": "EC2", "date": "2024-01-03", "cost": 20.0},
+            {"service": "EC2", "date": "2024-01-03", "cost": 5.0},
+        ])
+        self.assertIn("Decreasing", result["trends"])
+        self.assertIn("-50.0%", result["trends"])
+
+    def test_single_date_service_is_stable(self):
+        """Services whose records all share one date report a stable trend"""
+        result = self._analyze([
+            {"service": "S3", "date": "2024-01-01", "cost": 1.0},
+            {"service": "S3", "date": "2024-01-01", "cost": 9.0},
+        ])
+        self.assertIn("Stable", result["trends"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,7 +12,7 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from cloud_insight_ai.log_processor import analyze_logs
+from cloud_insight_ai.log_processor import LogProcessor, analyze_logs
 
 
 class TestLogProcessor(unittest.TestCase):
@@ -100,5 +100,34 @@ class TestLogAnomalyDetection(unittest.TestCase):
         self.assertIsNotNone(result)
 
 
+class TestLogProcessorParsing(unittest.TestCase):
+    """Test cases for LogProcessor line parsing"""
+
+    def _parse(self, lines):
+        """Parse raw lines through LogProcessor._parse_logs"""
+        processor = LogProcessor(Mock())
+        processor.log_entries = [
+            (line, 'data/logs.txt', 'application', 'app logs')
+            for line in lines
+        ]
+        return processor._parse_logs()
+
+    def test_message_less_lines_are_dropped(self):
+        """Lines with a level tag but no message are skipped"""
+        parsed = self._parse([
+            "2024-01-01 10:00:00 [INFO] Service started\n",
+            "2024-01-01 10:00:01 [INFO]\n",
+            "2024-01-01 10:00:02 [INFO]   \n",
+        ])
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(parsed[0]["message"], "Service started")
+
+    def test_trailing_whitespace_is_trimmed(self):
+        """Messages keep no trailing whitespace or newline"""
+        parsed = self._parse(["2024-01-01 10:00:00 [ERROR] Disk full  \n"])
+        self.assertEqual(parsed[0]["level"], "ERROR")
+        self.assertEqual(parsed[0]["message"], "Disk full")
+
+
 if __name__ == "__main__":
     unittest.main()